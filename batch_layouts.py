@@ -0,0 +1,185 @@
+"""Generate and validate many dungeon layouts in parallel, without Ursina.
+
+    python batch_layouts.py -n 100000 --rooms 8 -o stats.jsonl
+
+Layout ``k`` uses seed ``--seed + k``, so any floor in the output can be
+rebuilt with ``generate_layout(rooms, random.Random(seed))``. The output is
+JSON lines: one ``chunk`` record per finished chunk, one ``invalid`` record
+per layout that fails validation, optional ``layout`` records
+(``--per-layout``) and a final ``summary`` with the totals and throughput.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+from layout import NUM_ROOMS, generate_layout, layout_stats, validate_layout
+
+# Aim for this many tasks per worker so no core idles while the last few
+# chunks finish, within bounds that keep per-task overhead small.
+TASKS_PER_WORKER = 4
+MIN_CHUNK_SIZE = 1
+MAX_CHUNK_SIZE = 1000
+STAT_NAMES = ('dead_ends', 'loot', 'reachable_loot', 'stairs_distance', 'bbox_width', 'bbox_depth', 'bbox_area')
+
+
+# --- Aggregation ---
+def empty_aggregate():
+    return {'layouts': 0, 'invalid': 0, 'stats': {name: {} for name in STAT_NAMES}}
+
+
+def add_to_aggregate(aggregate, stats, valid):
+    aggregate['layouts'] += 1
+    if not valid:
+        aggregate['invalid'] += 1
+    for name in STAT_NAMES:
+        histogram = aggregate['stats'][name]
+        histogram[stats[name]] = histogram.get(stats[name], 0) + 1
+
+
+def merge_aggregate(total, part):
+    total['layouts'] += part['layouts']
+    total['invalid'] += part['invalid']
+    for name in STAT_NAMES:
+        histogram = total['stats'][name]
+        for value, count in part['stats'][name].items():
+            histogram[value] = histogram.get(value, 0) + count
+
+
+def summarize_histogram(histogram):
+    count = sum(histogram.values())
+    if not count:
+        return {}
+    values = sorted(histogram)
+    summary = {'min': values[0], 'max': values[-1],
+               'mean': sum(v * c for v, c in histogram.items()) / count}
+    for label, fraction in (('p50', 0.5), ('p95', 0.95)):
+        target = fraction * count
+        seen = 0
+        for value in values:
+            seen += histogram[value]
+            if seen >= target:
+                summary[label] = value
+                break
+    return summary
+
+
+def describe_aggregate(aggregate):
+    return {
+        'layouts': aggregate['layouts'],
+        'invalid': aggregate['invalid'],
+        'stats': {name: summarize_histogram(aggregate['stats'][name]) for name in STAT_NAMES},
+    }
+
+
+# --- Workers ---
+def run_chunk(task):
+    """Generate, validate and aggregate one contiguous block of seeds."""
+    first_seed, count, num_rooms, per_layout = task
+    started = time.perf_counter()
+    aggregate = empty_aggregate()
+    records = []
+    for seed in range(first_seed, first_seed + count):
+        layout = generate_layout(num_rooms, random.Random(seed))
+        problems = validate_layout(layout)
+        stats = layout_stats(layout)
+        add_to_aggregate(aggregate, stats, not problems)
+        if problems:
+            records.append({'type': 'invalid', 'seed': seed, 'problems': problems, 'stats': stats})
+        elif per_layout:
+            records.append({'type': 'layout', 'seed': seed, 'stats': stats})
+    return first_seed, aggregate, records, time.perf_counter() - started
+
+
+def default_chunk_size(count, workers):
+    size = -(-count // (workers * TASKS_PER_WORKER))
+    return max(MIN_CHUNK_SIZE, min(MAX_CHUNK_SIZE, size))
+
+
+def chunk_tasks(count, seed, chunk_size, num_rooms, per_layout):
+    for start in range(0, count, chunk_size):
+        yield (seed + start, min(chunk_size, count - start), num_rooms, per_layout)
+
+
+# --- CLI ---
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Generate and validate dungeon layouts in parallel.')
+    parser.add_argument('-n', '--count', type=int, default=10000, help='layouts to generate (default: %(default)s)')
+    parser.add_argument('--rooms', type=int, default=NUM_ROOMS, help='rooms per layout (default: %(default)s)')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the first layout (default: %(default)s)')
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count() or 1,
+                        help='worker processes (default: all cores, %(default)s)')
+    parser.add_argument('--chunk-size', type=int, default=None,
+                        help=f'layouts per task sent to a worker (default: count / (workers * '
+                             f'{TASKS_PER_WORKER}), between {MIN_CHUNK_SIZE} and {MAX_CHUNK_SIZE})')
+    parser.add_argument('-o', '--output', default='-', help='JSON-lines output file, - for stdout')
+    parser.add_argument('--per-layout', action='store_true', help='also write one record per valid layout')
+    args = parser.parse_args(argv)
+    if args.rooms < 2:
+        parser.error('--rooms must be at least 2 (stairs cannot be in room 0)')
+    if args.count < 1 or args.workers < 1 or (args.chunk_size is not None and args.chunk_size < 1):
+        parser.error('--count, --workers and --chunk-size must be positive')
+    if args.chunk_size is None:
+        args.chunk_size = default_chunk_size(args.count, args.workers)
+    return args
+
+
+def write_record(out, record):
+    out.write(json.dumps(record, sort_keys=True) + '\n')
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    out = sys.stdout if args.output == '-' else open(args.output, 'w')
+    total = empty_aggregate()
+    busy_time = 0.0
+    started = time.perf_counter()
+    tasks = chunk_tasks(args.count, args.seed, args.chunk_size, args.rooms, args.per_layout)
+    try:
+        with multiprocessing.Pool(args.workers) as pool:
+            # Chunks are written as they finish, so memory stays flat however
+            # many layouts are requested.
+            for first_seed, aggregate, records, elapsed in pool.imap_unordered(run_chunk, tasks):
+                for record in records:
+                    write_record(out, record)
+                write_record(out, {'type': 'chunk', 'first_seed': first_seed, 'seconds': elapsed,
+                                   **describe_aggregate(aggregate)})
+                merge_aggregate(total, aggregate)
+                busy_time += elapsed
+        wall_time = time.perf_counter() - started
+        throughput = {
+            'workers': args.workers,
+            'chunk_size': args.chunk_size,
+            'wall_seconds': wall_time,
+            'layouts_per_second': total['layouts'] / wall_time if wall_time else 0.0,
+            'layouts_per_second_per_worker': total['layouts'] / wall_time / args.workers if wall_time else 0.0,
+            # Single-core speed inside the workers; per_worker / this shows how
+            # close to linear the pool scaled.
+            'layouts_per_busy_second': total['layouts'] / busy_time if busy_time else 0.0,
+        }
+        write_record(out, {'type': 'summary', 'rooms': args.rooms, 'seed': args.seed,
+                           'throughput': throughput, **describe_aggregate(total)})
+        out.flush()
+    except BrokenPipeError:
+        # The reader went away (e.g. piped into head). Point stdout at devnull
+        # so the interpreter's final flush does not raise again.
+        if out is sys.stdout:
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, sys.stdout.fileno())
+        return 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print(f"{total['layouts']} layouts ({total['invalid']} invalid) in {wall_time:.2f}s: "
+          f"{throughput['layouts_per_second']:.0f}/s, "
+          f"{throughput['layouts_per_second_per_worker']:.0f}/s per worker "
+          f"(single worker {throughput['layouts_per_busy_second']:.0f}/s)", file=sys.stderr)
+    return 1 if total['invalid'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,4 @@
+"""Headless benchmark suite for the dungeon game.
+
+Run with ``python -m benchmarks`` from the repository root.
+"""
@@ -0,0 +1,75 @@
+import argparse
+import fnmatch
+import os
+import sys
+
+from benchmarks.harness import boot_headless, build_report, compare, load_report, summarize, write_report
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks',
+                                     description='Run the headless game benchmarks.')
+    parser.add_argument('-o', '--output', default='bench_results.json',
+                        help='where to write the JSON results (default: %(default)s)')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE,
+                        help='baseline JSON to compare against (default: benchmarks/baseline.json)')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='store this run as the new baseline instead of comparing')
+    parser.add_argument('--threshold', type=float, default=0.15,
+                        help='allowed slowdown before a scenario counts as a regression (default: %(default)s)')
+    parser.add_argument('--metric', choices=('median_ms', 'p95_ms'), default='median_ms',
+                        help='statistic compared against the baseline (default: %(default)s)')
+    parser.add_argument('--seed', type=int, default=1234, help='random seed for dungeon layouts')
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help='multiply every scenario\'s iteration count')
+    parser.add_argument('-k', '--filter', default='*',
+                        help='only run scenarios whose name matches this glob')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    game = boot_headless()
+
+    # Imported after boot so ursina is already running headless.
+    from benchmarks.scenarios import get_scenarios
+
+    default_rooms = game.NUM_ROOMS
+    results = {}
+    for name, run, iterations in get_scenarios():
+        if not fnmatch.fnmatchcase(name, args.filter):
+            continue
+        iterations = max(1, int(iterations * args.scale))
+        try:
+            samples = run(game, args.seed, iterations)
+        finally:
+            game.NUM_ROOMS = default_rooms
+        results[name] = summarize(samples)
+        print(f"{name:<28} median {results[name]['median_ms']:8.3f} ms   p95 {results[name]['p95_ms']:8.3f} ms")
+
+    report = build_report(results, args.seed)
+    write_report(report, args.output)
+    print(f"Results written to {args.output}")
+
+    if args.save_baseline:
+        write_report(report, args.baseline)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one.")
+        return 0
+
+    regressions = compare(report, load_report(args.baseline), args.threshold, args.metric)
+    for name, previous, current, ratio in regressions:
+        print(f"REGRESSION {name}: {previous:.3f} ms -> {current:.3f} ms ({(ratio - 1) * 100:+.1f}%)")
+    if regressions:
+        return 1
+    print(f"No regressions above {args.threshold * 100:.0f}% on {args.metric}.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,64 @@
+import argparse
+import sys
+
+from benchmarks.harness import boot_headless
+
+# Counted from the scene graph before frustum culling: every visible Geom is
+# one draw call, however many instances it carries.
+
+
+def count_draw_calls(root):
+    total = 0
+    for node_path in root.find_all_matches('**/+GeomNode'):
+        if node_path.is_hidden():
+            continue
+        total += node_path.node().get_num_geoms()
+    return total
+
+
+def measure_floor(game, use_instancing, num_rooms, seed):
+    from benchmarks.scenarios import build_dungeon
+    from ursina import application
+
+    game.USE_INSTANCING = use_instancing
+    build_dungeon(game, seed, num_rooms)
+    for room in game.rooms.values():
+        room.set_visible(True)
+        room.set_doors_visible(True)
+    for renderer in game.props.values():
+        renderer.flush()
+    return count_draw_calls(application.base.render)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.draw_calls',
+                                     description='Compare draw calls with and without prop instancing.')
+    parser.add_argument('--rooms', type=int, default=128, help='rooms on the floor (default: %(default)s)')
+    parser.add_argument('--seed', type=int, default=1234, help='random seed for the layout')
+    parser.add_argument('--force', action='store_true',
+                        help='build instanced props even if this GPU cannot draw them '
+                             '(the count comes from the scene graph, so it is still valid)')
+    args = parser.parse_args(argv)
+
+    game = boot_headless()
+    if args.force:
+        game.instancing_supported = lambda: True
+    elif not game.instancing_supported():
+        print("This GPU cannot run the instanced shaders; both counts use plain entities. "
+              "Pass --force to count the instanced scene anyway.")
+    default_instancing = game.USE_INSTANCING
+    try:
+        before = measure_floor(game, False, args.rooms, args.seed)
+        after = measure_floor(game, True, args.rooms, args.seed)
+    finally:
+        game.USE_INSTANCING = default_instancing
+
+    props = sum(len(renderer.instances) for renderer in game.props.values())
+    print(f"{args.rooms} rooms, {props} props, every room visible")
+    print(f"draw calls without instancing: {before}")
+    print(f"draw calls with instancing:    {after}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,127 @@
+import json
+import os
+import platform
+import sys
+import time
+import datetime
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FRAME_DT = 1 / 60
+
+
+# --- Headless Boot ---
+def boot_headless():
+    """Start Ursina without a visible window and import the game module.
+
+    Must run before ``game`` is imported anywhere: Ursina is a singleton, so
+    the ``Ursina()`` call at the top of game.py reuses this instance.
+    """
+    from panda3d.core import loadPrcFileData
+    loadPrcFileData('', 'load-display p3headlessgl\n'
+                        'aux-display p3tinydisplay\n'
+                        'audio-library-name null\n')
+
+    from ursina import Ursina, mouse
+    Ursina(window_type='offscreen', development_mode=True)
+
+    # Locking the mouse asks the window for new properties, which an
+    # offscreen buffer does not have. Keep the flag, skip the request.
+    type(mouse).locked = property(
+        lambda self: getattr(self, '_locked', False),
+        lambda self, value: setattr(self, '_locked', value)
+    )
+
+    if ROOT_DIR not in sys.path:
+        sys.path.insert(0, ROOT_DIR)
+    import game
+    return game
+
+
+def set_frame_dt(dt=FRAME_DT):
+    # Ursina keeps the frame delta on the stdlib time module.
+    time.dt = dt
+
+
+# --- Timing ---
+def measure(step, iterations, warmup=0, before=None):
+    """Time ``step()`` ``iterations`` times and return samples in seconds.
+
+    ``before(i)`` runs untimed ahead of every call, including warmup calls.
+    """
+    samples = []
+    for i in range(warmup + iterations):
+        if before:
+            before(i)
+        start = time.perf_counter()
+        step()
+        elapsed = time.perf_counter() - start
+        if i >= warmup:
+            samples.append(elapsed)
+    return samples
+
+
+def percentile(sorted_samples, pct):
+    if not sorted_samples:
+        return 0.0
+    rank = max(0, min(len(sorted_samples) - 1, int(round(pct / 100 * len(sorted_samples))) - 1))
+    return sorted_samples[rank]
+
+
+def summarize(samples):
+    ordered = sorted(samples)
+    n = len(ordered)
+    if n == 0:
+        return {'iterations': 0}
+    mid = n // 2
+    median = ordered[mid] if n % 2 else (ordered[mid - 1] + ordered[mid]) / 2
+    return {
+        'iterations': n,
+        'median_ms': median * 1000,
+        'p95_ms': percentile(ordered, 95) * 1000,
+        'mean_ms': sum(ordered) / n * 1000,
+        'min_ms': ordered[0] * 1000,
+        'max_ms': ordered[-1] * 1000,
+    }
+
+
+# --- Results ---
+def build_report(results, seed):
+    return {
+        'meta': {
+            'timestamp': datetime.datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'seed': seed,
+        },
+        'results': results,
+    }
+
+
+def write_report(report, path):
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def load_report(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(report, baseline, threshold, metric='median_ms'):
+    """Return ``(name, baseline, current, ratio)`` for every regressed scenario.
+
+    A scenario regresses when ``current > baseline * (1 + threshold)``.
+    Scenarios missing from either side are ignored.
+    """
+    regressions = []
+    for name, current in report['results'].items():
+        previous = baseline.get('results', {}).get(name)
+        if not previous or metric not in previous or metric not in current:
+            continue
+        if previous[metric] <= 0:
+            continue
+        ratio = current[metric] / previous[metric]
+        if ratio > 1 + threshold:
+            regressions.append((name, previous[metric], current[metric], ratio))
+    return regressions
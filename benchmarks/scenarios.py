@@ -0,0 +1,149 @@
+import math
+import random
+
+from ursina import destroy, held_keys
+
+from benchmarks.harness import measure, set_frame_dt
+
+GENERATE_ROOM_COUNTS = (8, 32, 128)
+PRELOAD_ROOM_COUNTS = (8, 32)
+DOOR_CROSSING_STEPS = 30
+
+
+# --- Helpers ---
+def clear_dungeon(game):
+    for room in game.rooms.values():
+        for e in room.entities + room.props:
+            try:
+                destroy(e)
+            except Exception:
+                pass
+    game.rooms.clear()
+
+
+def build_dungeon(game, seed, num_rooms):
+    clear_dungeon(game)
+    game.NUM_ROOMS = num_rooms
+    random.seed(seed)
+    game.generate_dungeon()
+
+
+def spawn_neighbour(game):
+    # A room joined to room 0 by a door that holds no stairs, so walking
+    # into it never triggers a new floor mid-benchmark.
+    spawn = game.rooms[0]
+    for direction in sorted(spawn.doors):
+        offset = game.DIRS[direction]
+        target = tuple(spawn.pos[j] + offset[j] for j in range(3))
+        for room in game.rooms.values():
+            if room.pos == target and not room.has_stairs:
+                return room
+    return None
+
+
+def prepare_floor(game, seed, num_rooms):
+    """Build a floor with a stairs-free neighbour of room 0 and a live player."""
+    while True:
+        build_dungeon(game, seed, num_rooms)
+        neighbour = spawn_neighbour(game)
+        if neighbour is not None:
+            break
+        seed += 1
+    game.start_game()
+    set_frame_dt()
+    held_keys.clear()
+    return neighbour
+
+
+def place_player(game, x, z):
+    game.player.position = (x, 1.5, z)
+
+
+# --- Scenarios ---
+def bench_generate(game, seed, iterations, num_rooms):
+    state = {'seed': seed}
+
+    def before(i):
+        clear_dungeon(game)
+        game.NUM_ROOMS = num_rooms
+        random.seed(state['seed'] + i)
+
+    return measure(game.generate_dungeon, iterations, warmup=2, before=before)
+
+
+def bench_update_idle(game, seed, iterations):
+    prepare_floor(game, seed, game.NUM_ROOMS)
+    place_player(game, 0, 0)
+    return measure(game.update, iterations, warmup=10)
+
+
+def bench_update_walking(game, seed, iterations):
+    prepare_floor(game, seed, game.NUM_ROOMS)
+
+    # Circle inside room 0: the player moves every frame but never leaves it.
+    def before(i):
+        angle = i * 0.1
+        place_player(game, math.cos(angle) * 2, math.sin(angle) * 2)
+
+    return measure(game.update, iterations, warmup=10, before=before)
+
+
+def bench_update_door_crossing(game, seed, iterations):
+    neighbour = prepare_floor(game, seed, game.NUM_ROOMS)
+    start = game.rooms[0].pos
+    end = neighbour.pos
+
+    # Walk back and forth between the two room centres through the door.
+    def before(i):
+        leg, step = divmod(i, DOOR_CROSSING_STEPS)
+        t = step / (DOOR_CROSSING_STEPS - 1)
+        if leg % 2:
+            t = 1 - t
+        place_player(game, start[0] + (end[0] - start[0]) * t, start[2] + (end[2] - start[2]) * t)
+
+    return measure(game.update, iterations, warmup=10, before=before)
+
+
+def bench_update_minimap(game, seed, iterations):
+    prepare_floor(game, seed, game.NUM_ROOMS)
+    return measure(lambda: game.update_minimap((0, 1.5, 0)), iterations, warmup=10)
+
+
+def bench_preload_rooms(game, seed, iterations, num_rooms):
+    build_dungeon(game, seed, num_rooms)
+    return measure(lambda: game.preload_rooms(0, max_rooms=4), iterations, warmup=10)
+
+
+def bench_player_update(game, seed, iterations):
+    prepare_floor(game, seed, game.NUM_ROOMS)
+    place_player(game, 0, 0)
+    player = game.player
+
+    # Alternate between walking diagonally and coasting to a stop.
+    def before(i):
+        walking = (i // 60) % 2 == 0
+        held_keys['w'] = 1 if walking else 0
+        held_keys['d'] = 1 if walking else 0
+
+    samples = measure(player.update, iterations, warmup=10, before=before)
+    held_keys.clear()
+    return samples
+
+
+def get_scenarios():
+    """Return ``(name, callable(game, seed, iterations), iterations)`` tuples."""
+    scenarios = []
+    for n in GENERATE_ROOM_COUNTS:
+        scenarios.append((f'generate_dungeon[{n}]',
+                          lambda game, seed, it, n=n: bench_generate(game, seed, it, n), 20))
+    for n in PRELOAD_ROOM_COUNTS:
+        scenarios.append((f'preload_rooms[{n}]',
+                          lambda game, seed, it, n=n: bench_preload_rooms(game, seed, it, n), 300))
+    scenarios += [
+        ('update[idle]', bench_update_idle, 300),
+        ('update[walking]', bench_update_walking, 300),
+        ('update[door_crossing]', bench_update_door_crossing, DOOR_CROSSING_STEPS * 10),
+        ('update_minimap', bench_update_minimap, 300),
+        ('player.update', bench_player_update, 300),
+    ]
+    return scenarios
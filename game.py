@@ -4,6 +4,7 @@ import json
 import datetime
 import traceback
 import random
+import time
 
 # --- Error Logging ---
 def log_error_txt(error_message):
@@ -16,21 +17,94 @@ def log_error_txt(error_message):
     except Exception as e:
         print(f"Failed to write to error log: {e}")
 
+# --- Startup Timing ---
+STARTUP_BUDGET = 1.5  # seconds from launch to the first frame
+startup_start = time.perf_counter()
+startup_phases = []
+_phase_start = startup_start
+
+def mark_startup_phase(name):
+    global _phase_start
+    now = time.perf_counter()
+    startup_phases.append((name, now - _phase_start))
+    _phase_start = now
+
 try:
     from ursina import *
     from player import ImprovedFirstPersonController
-    from shaders import create_shaders, apply_shader
+    from shaders import create_shaders, create_instanced_shaders, apply_shader
+    from quality import QualityGovernor
+    from instancing import InstancedProps, PropInstance, instancing_supported
+    from layout import ROOM_SIZE, NUM_ROOMS, DIRS, OPPOSITE, generate_layout
 except Exception as e:
     tb = traceback.format_exc()
     log_error_txt(f"Import error: {str(e)}\n{tb}")
     print("Import error. See error_log.txt for details.")
     sys.exit(1)
+mark_startup_phase('import')
 
-# --- Game Constants ---
-ROOM_SIZE = 8
-NUM_ROOMS = 8
-DIRS = {'N': (0, 0, ROOM_SIZE), 'S': (0, 0, -ROOM_SIZE), 'E': (ROOM_SIZE, 0, 0), 'W': (-ROOM_SIZE, 0, 0)}
-OPPOSITE = {'N': 'S', 'S': 'N', 'E': 'W', 'W': 'E'}
+# --- Quality Governor ---
+quality = QualityGovernor()
+QUALITY_LOG = "quality_log.txt"
+
+def log_quality_change(decision):
+    timestamp = datetime.datetime.fromtimestamp(decision['time']).isoformat()
+    entry = (f"[{timestamp}] {decision['from']} -> {decision['to']}: {decision['reason']} "
+             f"(avg {decision['average_ms']:.1f}ms, budget {decision['budget_ms']:.1f}ms)")
+    print(f"Quality: {entry}")
+    try:
+        with open(QUALITY_LOG, "a") as f:
+            f.write(entry + "\n")
+    except Exception as e:
+        print(f"Failed to write to quality log: {e}")
+
+# --- Instanced Props ---
+# Doors, loot and stairs are drawn by one InstancedProps per kind instead of
+# one cube entity each. Without GPU support for the instanced shaders, if they
+# fail to compile, or with USE_INSTANCING = False, each prop draws its own cube.
+USE_INSTANCING = True
+PROP_SHADERS = {'door': 'flat', 'loot': 'flat', 'stairs': 'lit'}
+props = {}
+instanced_shaders = None
+
+def get_prop_renderer(kind):
+    global instanced_shaders
+    if not USE_INSTANCING or not instancing_supported():
+        return None
+    if kind not in props:
+        if instanced_shaders is None:
+            instanced_shaders = create_instanced_shaders()
+        lit_shader, flat_shader = instanced_shaders
+        if lit_shader is None or flat_shader is None:
+            return None
+        shader = lit_shader if PROP_SHADERS[kind] == 'lit' and quality.tier['lighting'] else flat_shader
+        try:
+            props[kind] = InstancedProps(shader)
+        except Exception as e:
+            log_error_txt(f"Failed to create instanced {kind} props: {str(e)}")
+            return None
+    if props[kind].failed:
+        return None
+    return props[kind]
+
+def make_prop(kind, position, scale, prop_color, collider=None, shown=True):
+    renderer = get_prop_renderer(kind)
+    if renderer is None:
+        return PropInstance(None, 0, prop_color, shown=shown, position=position, scale=scale,
+                            collider=collider)
+    return renderer.add(position, scale, prop_color, collider=collider, shown=shown)
+
+def clear_props():
+    for renderer in props.values():
+        renderer.clear()
+
+def set_prop_lighting(enabled):
+    if not instanced_shaders:
+        return
+    lit_shader, flat_shader = instanced_shaders
+    for kind, renderer in props.items():
+        if PROP_SHADERS[kind] == 'lit':
+            renderer.set_instance_shader(lit_shader if enabled else flat_shader)
 
 # --- Room Class ---
 class Room3D:
@@ -44,6 +118,8 @@ class Room3D:
             self.wall_entities = {}
             self.door_defs = set()
             self.entities = []
+            self.props = []
+            self.lit_entities = []
             self.has_stairs = has_stairs
             
             # Create shaders with error handling
@@ -58,16 +134,17 @@ class Room3D:
             
             if has_stairs:
                 try:
-                    self.stairs = Entity(
-                        model='cube',
-                        color=color.lime,
-                        scale=(2, 2, 2),
-                        position=(self.pos[0], 1, self.pos[2] - 2),
+                    self.stairs = make_prop(
+                        'stairs',
+                        (self.pos[0], 1, self.pos[2] - 2),
+                        (2, 2, 2),
+                        color.lime,
                         collider='box',
-                        enabled=False
+                        shown=False
                     )
-                    apply_shader(self.stairs, self.lighting_shader)
-                    self.entities.append(self.stairs)
+                    self.lit_entities.append(self.stairs)
+                    self.set_lighting(quality.tier['lighting'])
+                    self.props.append(self.stairs)
                 except Exception as e:
                     log_error(f"Failed to create stairs: {str(e)}")
                     self.stairs = None
@@ -126,6 +203,12 @@ class Room3D:
             log_error(f"Error in create_walls: {str(e)}")
             raise
 
+    def remove_wall(self, direction):
+        wall = self.wall_entities.pop(direction, None)
+        if wall:
+            self.entities.remove(wall)
+            destroy(wall)
+
     def add_door(self, direction):
         self.door_defs.add(direction)
 
@@ -136,7 +219,7 @@ class Room3D:
         wall_thickness = 0.5
         for direction in self.door_defs:
             if direction == 'N':
-                destroy(self.wall_entities['N'])
+                self.remove_wall('N')
                 left = Entity(model='cube', color=color.rgb(120, 70, 30),
                               scale=((ROOM_SIZE - door_width) / 2, wall_height, wall_thickness),
                               position=(self.pos[0] - (door_width / 2 + (ROOM_SIZE - door_width) / 4), wall_height / 2,
@@ -148,11 +231,11 @@ class Room3D:
                                          self.pos[2] + ROOM_SIZE / 2),
                                collider='box', enabled=True)
                 door_pos = (self.pos[0], door_height / 2, self.pos[2] + ROOM_SIZE / 2 + 0.01)
-                door = Entity(model='cube', color=color.yellow, scale=(door_width, door_height, 0.3),
-                              position=door_pos, collider=None, enabled=True)
-                self.entities += [left, right, door]
+                door = make_prop('door', door_pos, (door_width, door_height, 0.3), color.yellow)
+                self.entities += [left, right]
+                self.props.append(door)
             elif direction == 'S':
-                destroy(self.wall_entities['S'])
+                self.remove_wall('S')
                 left = Entity(model='cube', color=color.rgb(120, 70, 30),
                               scale=((ROOM_SIZE - door_width) / 2, wall_height, wall_thickness),
                               position=(self.pos[0] - (door_width / 2 + (ROOM_SIZE - door_width) / 4), wall_height / 2,
@@ -160,15 +243,15 @@ class Room3D:
                               collider='box', enabled=True)
                 right = Entity(model='cube', color=color.rgb(120, 70, 30),
                                scale=((ROOM_SIZE - door_width) / 2, wall_height, wall_thickness),
-                               position=(self.pos[0] + (doorWidth / 2 + (ROOM_SIZE - door_width) / 4), wall_height / 2,
+                               position=(self.pos[0] + (door_width / 2 + (ROOM_SIZE - door_width) / 4), wall_height / 2,
                                          self.pos[2] - ROOM_SIZE / 2),
                                collider='box', enabled=True)
                 door_pos = (self.pos[0], door_height / 2, self.pos[2] - ROOM_SIZE / 2 - 0.01)
-                door = Entity(model='cube', color=color.yellow, scale=(door_width, door_height, 0.3),
-                              position=door_pos, collider=None, enabled=True)
-                self.entities += [left, right, door]
+                door = make_prop('door', door_pos, (door_width, door_height, 0.3), color.yellow)
+                self.entities += [left, right]
+                self.props.append(door)
             elif direction == 'E':
-                destroy(self.wall_entities['E'])
+                self.remove_wall('E')
                 left = Entity(model='cube', color=color.rgb(120, 70, 30),
                               scale=(wall_thickness, wall_height, (ROOM_SIZE - door_width) / 2),
                               position=(self.pos[0] + ROOM_SIZE / 2, wall_height / 2,
@@ -180,11 +263,11 @@ class Room3D:
                                          self.pos[2] + (door_width / 2 + (ROOM_SIZE - door_width) / 4)),
                                collider='box', enabled=True)
                 door_pos = (self.pos[0] + ROOM_SIZE / 2 + 0.01, door_height / 2, self.pos[2])
-                door = Entity(model='cube', color=color.yellow, scale=(0.3, door_height, door_width),
-                              position=door_pos, collider=None, enabled=True)
-                self.entities += [left, right, door]
+                door = make_prop('door', door_pos, (0.3, door_height, door_width), color.yellow)
+                self.entities += [left, right]
+                self.props.append(door)
             elif direction == 'W':
-                destroy(self.wall_entities['W'])
+                self.remove_wall('W')
                 left = Entity(model='cube', color=color.rgb(120, 70, 30),
                               scale=(wall_thickness, wall_height, (ROOM_SIZE - door_width) / 2),
                               position=(self.pos[0] - ROOM_SIZE / 2, wall_height / 2,
@@ -193,18 +276,18 @@ class Room3D:
                 right = Entity(model='cube', color=color.rgb(120, 70, 30),
                                scale=(wall_thickness, wall_height, (ROOM_SIZE - door_width) / 2),
                                position=(self.pos[0] - ROOM_SIZE / 2, wall_height / 2,
-                                         self.pos[2] + (doorWidth / 2 + (ROOM_SIZE - door_width) / 4)),
+                                         self.pos[2] + (door_width / 2 + (ROOM_SIZE - door_width) / 4)),
                                collider='box', enabled=True)
                 door_pos = (self.pos[0] - ROOM_SIZE / 2 - 0.01, door_height / 2, self.pos[2])
-                door = Entity(model='cube', color=color.yellow, scale=(0.3, door_height, door_width),
-                              position=door_pos, collider=None, enabled=True)
-                self.entities += [left, right, door]
+                door = make_prop('door', door_pos, (0.3, door_height, door_width), color.yellow)
+                self.entities += [left, right]
+                self.props.append(door)
             self.doors[direction] = door
 
     def spawn_loot(self):
-        self.loot = Entity(model='cube', color=color.green, scale=(0.7, 0.7, 0.7),
-                           position=(self.pos[0] + 2, 1, self.pos[2]), collider='box', enabled=False)
-        self.entities.append(self.loot)
+        self.loot = make_prop('loot', (self.pos[0] + 2, 1, self.pos[2]), (0.7, 0.7, 0.7), color.green,
+                              collider='box', shown=False)
+        self.props.append(self.loot)
 
     def set_visible(self, visible: bool):
         for e in self.entities:
@@ -212,16 +295,19 @@ class Room3D:
                 e.enabled = visible
             except AssertionError:
                 print(f"Warning: Could not set visibility for entity {e}")
-        if self.loot:
-            self.loot.enabled = visible
-        if self.has_stairs and self.stairs:
-            self.stairs.enabled = visible
+        for prop in self.props:
+            prop.shown = visible
+
+    def set_lighting(self, enabled: bool):
+        shader = self.lighting_shader if enabled else self.wall_shader
+        for e in self.lit_entities:
+            apply_shader(e, shader)
 
     def set_doors_visible(self, visible: bool):
         for direction, door in self.doors.items():
             if door:
                 try:
-                    door.enabled = visible
+                    door.shown = visible
                 except Exception as ex:
                     print(f"Warning: Could not set door visibility: {ex}")
 
@@ -230,24 +316,14 @@ rooms = {}
 
 def generate_dungeon():
     rooms.clear()
-    stairs_room = random.randint(1, NUM_ROOMS - 1)
-    rooms[0] = Room3D((0, 0, 0), 0)
-    for i in range(1, NUM_ROOMS):
-        has_stairs = (i == stairs_room)
-        while True:
-            base_id = random.choice(list(rooms.keys()))
-            base_pos = rooms[base_id].pos
-            dir = random.choice(list(DIRS.keys()))
-            new_pos = tuple(base_pos[j] + DIRS[dir][j] for j in range(3))
-            if new_pos not in [r.pos for r in rooms.values()]:
-                rooms[i] = Room3D(new_pos, i, has_stairs=has_stairs)
-                rooms[base_id].add_door(dir)
-                rooms[i].add_door(OPPOSITE[dir])
-                break
-    for i, room in rooms.items():
-        if i != 0:
-            if random.random() < 0.7:
-                room.spawn_loot()
+    clear_props()
+    layout = generate_layout(NUM_ROOMS)
+    for i, pos in enumerate(layout.positions):
+        rooms[i] = Room3D(pos, i, has_stairs=(i == layout.stairs_room))
+        for direction in layout.doors[i]:
+            rooms[i].add_door(direction)
+    for i in sorted(layout.loot_rooms):
+        rooms[i].spawn_loot()
     for room in rooms.values():
         room.finalize_doors()
         room.set_visible(False)
@@ -268,6 +344,7 @@ def preload_rooms(current_room_id, max_rooms=4):
                     break
 
 app = Ursina()
+mark_startup_phase('window')
 
 # --- UI Panels ---
 def create_start_panel():
@@ -310,67 +387,83 @@ def create_pause_menu():
     )
 
 # --- HUD Panel ---
-hud_panel = Panel(
-    parent=camera.ui,
-    model='quad',
-    color=color.black.tint(-0.7),
-    scale=(0.5, 0.25),
-    position=(-0.7, 0.4),
-    enabled=True
-)
+hud_panel = None
+fps_text = None
+hp_text = None
+gold_text = None
+lore_text = None
+
+def ensure_hud():
+    global hud_panel, fps_text, hp_text, gold_text, lore_text
+    if hud_panel is not None:
+        return
+    hud_panel = Panel(
+        parent=camera.ui,
+        model='quad',
+        color=color.black.tint(-0.7),
+        scale=(0.5, 0.25),
+        position=(-0.7, 0.4),
+        enabled=True
+    )
 
-fps_text = Text(
-    parent=hud_panel,
-    text='FPS: 0',
-    position=(-0.22, 0.08),
-    scale=1.2,
-    background=False,
-    color=color.white,
-    origin=(0, 0),
-    enabled=True
-)
+    fps_text = Text(
+        parent=hud_panel,
+        text='FPS: 0',
+        position=(-0.22, 0.08),
+        scale=1.2,
+        background=False,
+        color=color.white,
+        origin=(0, 0),
+        enabled=True
+    )
 
-hp_text = Text(
-    parent=hud_panel,
-    text='HP: 30',
-    position=(-0.22, 0.02),
-    scale=1.2,
-    background=False,
-    color=color.red,
-    enabled=True
-)
+    hp_text = Text(
+        parent=hud_panel,
+        text='HP: 30',
+        position=(-0.22, 0.02),
+        scale=1.2,
+        background=False,
+        color=color.red,
+        enabled=True
+    )
 
-gold_text = Text(
-    parent=hud_panel,
-    text='Gold: 0',
-    position=(-0.22, -0.04),
-    scale=1.2,
-    background=False,
-    color=color.yellow,
-    enabled=True
-)
+    gold_text = Text(
+        parent=hud_panel,
+        text='Gold: 0',
+        position=(-0.22, -0.04),
+        scale=1.2,
+        background=False,
+        color=color.yellow,
+        enabled=True
+    )
 
-lore_text = Text(
-    parent=hud_panel,
-    text='',
-    position=(-0.22, -0.10),
-    scale=1,
-    background=False,
-    color=color.white,
-    enabled=True
-)
+    lore_text = Text(
+        parent=hud_panel,
+        text='',
+        position=(-0.22, -0.10),
+        scale=1,
+        background=False,
+        color=color.white,
+        enabled=True
+    )
 
 # --- Minimap Feature ---
-minimap_panel = Panel(
-    parent=camera.ui,
-    model='quad',
-    color=color.black.tint(-0.7),
-    scale=(0.18, 0.18),
-    position=(0.7, 0.4),
-    enabled=True
-)
+minimap_panel = None
 minimap_entities = []
 
+def ensure_minimap():
+    global minimap_panel
+    if minimap_panel is not None:
+        return
+    minimap_panel = Panel(
+        parent=camera.ui,
+        model='quad',
+        color=color.black.tint(-0.7),
+        scale=(0.18, 0.18),
+        position=(0.7, 0.4),
+        enabled=True
+    )
+
 def update_minimap(player_pos):
     # Clear previous minimap entities
     for e in minimap_entities:
@@ -418,25 +511,121 @@ cursor = Entity(
 )
 cursor.visible = True
 
-floor = Entity(
-    model='plane',
-    color=color.gray,
-    scale=(ROOM_SIZE * 10, 1, ROOM_SIZE * 10),
-    position=(0, -0.5, 0),
-    collider='box',
-    double_sided=True,
-    enabled=True
-)
+floor = None
+
+def ensure_floor():
+    global floor
+    if floor is not None:
+        return
+    floor = Entity(
+        model='plane',
+        color=color.gray,
+        scale=(ROOM_SIZE * 10, 1, ROOM_SIZE * 10),
+        position=(0, -0.5, 0),
+        collider='box',
+        double_sided=True,
+        enabled=True
+    )
 
 window.vsync = True
 window.shadows = False
 
 tutorial_panel = create_tutorial_panel()
-pause_menu = create_pause_menu()
-pause_menu.enabled = False
+pause_menu = None
+mark_startup_phase('ui')
+
+def ensure_pause_menu():
+    global pause_menu
+    if pause_menu is not None:
+        return
+    pause_menu = create_pause_menu()
+    pause_menu.enabled = False
+
+def ensure_dungeon():
+    if rooms:
+        return
+    generate_dungeon()
+    preload_rooms(0, max_rooms=quality.tier['preload_rooms'])
+
+def display_refresh_interval():
+    try:
+        info = application.base.pipe.get_display_information()
+        index = info.get_current_display_mode_index()
+        if index >= 0:
+            rate = info.get_display_mode_refresh_rate(index)
+            if rate > 0:
+                return 1 / rate
+    except Exception as e:
+        log_error_txt(f"Failed to read display refresh rate: {str(e)}")
+    return None
+
+def apply_quality(tier):
+    try:
+        window.shadows_size = tier['shadows_size']
+        window.shadows = tier['shadows']
+    except Exception as e:
+        log_error_txt(f"Failed to set shadows: {str(e)}")
+        window.shadows = False
+    for room in rooms.values():
+        room.set_lighting(tier['lighting'])
+    set_prop_lighting(tier['lighting'])
+
+# --- Deferred Startup ---
+# Built one per frame behind the tutorial so the first frame is not held up.
+# start_game() runs whatever is still pending, so pressing Start early still works.
+startup_tasks = [
+    ('hud', ensure_hud),
+    ('minimap', ensure_minimap),
+    ('pause_menu', ensure_pause_menu),
+    ('floor', ensure_floor),
+    ('generation', ensure_dungeon),
+]
+startup_frames = 0
+startup_reported = False
+
+def run_startup_task():
+    name, task = startup_tasks.pop(0)
+    task_start = time.perf_counter()
+    try:
+        task()
+    except Exception as e:
+        log_error_txt(f"Startup task '{name}' failed: {str(e)}\n{traceback.format_exc()}")
+    startup_phases.append((f'deferred:{name}', time.perf_counter() - task_start))
+
+def startup_step():
+    global startup_frames
+    startup_frames += 1
+    # update() runs before the frame is drawn, so the first frame has only
+    # been rendered (shaders compiled, textures uploaded) by the second call.
+    if startup_frames == 1:
+        return
+    if startup_frames == 2:
+        mark_startup_phase('first_frame')
+    elif startup_tasks:
+        run_startup_task()
+    if startup_frames >= 2 and not startup_tasks:
+        finish_startup()
+
+def finish_startup():
+    global startup_reported
+    while startup_tasks:
+        run_startup_task()
+    if startup_frames >= 2 and not startup_reported:
+        startup_reported = True
+        report_startup()
+
+def report_startup():
+    first_frame = sum(t for name, t in startup_phases if not name.startswith('deferred:'))
+    parts = [f"{name} {t * 1000:.0f}ms" for name, t in startup_phases]
+    status = "OK" if first_frame <= STARTUP_BUDGET else "OVER BUDGET"
+    print(f"Startup: {', '.join(parts)} | time to first frame {first_frame:.2f}s "
+          f"(budget {STARTUP_BUDGET:.2f}s, {status})")
+    if first_frame > STARTUP_BUDGET:
+        log_error_txt(f"Startup over budget: {first_frame:.2f}s > {STARTUP_BUDGET:.2f}s\n{', '.join(parts)}")
 
 def toggle_pause():
     global game_paused
+    ensure_pause_menu()
     game_paused = not game_paused
     pause_menu.enabled = game_paused
     hud_panel.enabled = not game_paused
@@ -449,6 +638,7 @@ def toggle_pause():
     else:
         mouse.locked = True
         cursor.visible = False
+        quality.reset()
         if player:
             player.enabled = True
 
@@ -457,6 +647,7 @@ def start_game():
     try:
         game_started = True
         tutorial_panel.enabled = False
+        finish_startup()
         hud_panel.enabled = True
         minimap_panel.enabled = True
 
@@ -505,14 +696,9 @@ def start_game():
         try:
             window.vsync = True
             window.fps_counter.enabled = True
-            
-            # Only enable shadows if the system supports it
-            try:
-                window.shadows_size = 2048
-                window.shadows = True
-            except Exception as shadow_error:
-                log_error(f"Failed to enable shadows: {str(shadow_error)}")
-                window.shadows = False
+            # vsync paces frames to the display, so a 50 Hz screen can never beat 20 ms
+            quality.set_refresh_interval(display_refresh_interval())
+            apply_quality(quality.tier)
         except Exception as e:
             log_error(f"Failed to set graphics options: {str(e)}")
 
@@ -540,13 +726,24 @@ def input(key):
         print(tb)
         window.title = "Error in input - see error_log.json"
 
+minimap_timer = 0
+
 def update():
-    global player_hp, lore_msg, current_room, player_gold
+    global player_hp, lore_msg, current_room, player_gold, minimap_timer
+    # Keeps going after Start until the report has run, in case Start was
+    # pressed before the first frame had been drawn.
+    if not startup_reported:
+        startup_step()
     if not game_started or player is None or game_paused:
-        fps_text.text = f'FPS: {int(1 / time.dt) if time.dt > 0 else "inf"}'
+        if fps_text:
+            fps_text.text = f'FPS: {int(1 / time.dt) if time.dt > 0 else "inf"}'
         return
     try:
-        fps_text.text = f'FPS: {int(1 / time.dt) if time.dt > 0 else "inf"}'
+        fps_text.text = f'FPS: {int(1 / time.dt) if time.dt > 0 else "inf"} [{quality.tier["name"]}]'
+        new_tier = quality.record(time.dt)
+        if new_tier:
+            apply_quality(new_tier)
+            log_quality_change(quality.decisions[-1])
         player_pos = player.position
         room_loaded = False
         for i, room in rooms.items():
@@ -571,21 +768,24 @@ def update():
                     room.set_doors_visible(True)
                     current_room = i
                 break
-        preload_rooms(current_room, max_rooms=4)
+        preload_rooms(current_room, max_rooms=quality.tier['preload_rooms'])
         room = rooms[current_room]
-        if room.loot and player.intersects(room.loot).hit and room.loot.enabled:
+        if room.loot and player.intersects(room.loot).hit and room.loot.shown:
             lore_msg = random.choice(lore_msgs)
             player_gold += random.randint(1, 5)
-            room.loot.enabled = False
+            room.loot.shown = False
         if room.stairs and distance(player.position, room.stairs.position) < 2:
             lore_msg = "You ascend the stairs!"
             player.position = (0, 1, 0)
             generate_dungeon()
-            preload_rooms(0, max_rooms=4)
+            preload_rooms(0, max_rooms=quality.tier['preload_rooms'])
         hp_text.text = f'HP: {player_hp}'
         gold_text.text = f'Gold: {player_gold}'
         lore_text.text = lore_msg
-        update_minimap(player.position)
+        minimap_timer += time.dt
+        if minimap_timer >= quality.tier['minimap_interval']:
+            minimap_timer = 0
+            update_minimap(player.position)
     except Exception as e:
         tb = traceback.format_exc()
         log_error(tb)
@@ -598,8 +798,6 @@ app.update = update
 
 if __name__ == "__main__":
     try:
-        generate_dungeon()
-        preload_rooms(0, max_rooms=4)
         app.run()
     except Exception as e:
         tb = traceback.format_exc()
@@ -0,0 +1,176 @@
+from array import array
+
+from ursina import *
+from panda3d.core import Texture as BufferTexture, GeomEnums, OmniBoundingVolume
+from shaders import INSTANCE_TEXELS, apply_shader
+
+FLOATS_PER_INSTANCE = INSTANCE_TEXELS * 4
+
+
+def instancing_supported():
+    """True if the current GPU can run the shaders from create_instanced_shaders()."""
+    win = application.base.win if application.base else None
+    gsg = win.gsg if win else None
+    if gsg is None:
+        return False
+    return bool(gsg.supports_glsl and gsg.supports_buffer_texture and gsg.supports_geometry_instancing)
+
+
+class PropInstance(Entity):
+    """One door, loot cube or stairs block.
+
+    Keeps the position, scale and collider of the prop so game code can treat
+    it like any other entity. When it belongs to an InstancedProps it has no
+    model of its own and is drawn by the batch; without one (instancing off
+    or unsupported) it draws its own cube.
+
+    Show and hide it with ``shown``, not ``enabled``: that flips its bit in
+    the batch's visibility mask and its collider, and never stashes the node.
+    """
+    renderer = None
+    index = 0
+
+    def __init__(self, renderer, index, prop_color, shown=True, **kwargs):
+        if renderer is None:
+            kwargs['model'] = 'cube'
+        super().__init__(color=prop_color, **kwargs)
+        self.renderer = renderer
+        self.index = index
+        self.prop_color = prop_color
+        self._shown = None
+        self.shown = shown
+
+    @property
+    def shown(self):
+        return self._shown
+
+    @shown.setter
+    def shown(self, value):
+        if value == self._shown:
+            return
+        self._shown = value
+        if self.collider:
+            self.collision = value
+        if self.renderer:
+            self.renderer.set_instance_visible(self.index, value)
+        else:
+            self.visible = value
+
+    def detach(self):
+        """Leave the batch and draw this prop as a plain cube."""
+        self.renderer = None
+        self.model = 'cube'
+        self.color = self.prop_color
+        self.visible = self._shown
+
+    def on_destroy(self):
+        if self.renderer:
+            self.renderer.set_instance_visible(self.index, False)
+        self.renderer = None
+
+
+class InstancedProps(Entity):
+    """Draws every prop of one kind with a single instanced draw call.
+
+    Per-instance position, scale, colour and visibility are packed into a
+    buffer texture read by the shaders from create_instanced_shaders().
+    Changes are uploaded at most once per frame. If the shader fails to
+    compile on its first draw, every prop is detached back to a plain cube
+    and ``failed`` is set.
+    """
+
+    def __init__(self, shader, model='cube', capacity=64, **kwargs):
+        super().__init__(model=model, **kwargs)
+        self.instances = []
+        self.data = array('f')
+        self.capacity = 0
+        self.dirty = False
+        self.failed = False
+        self.shader_check = None
+        self.buffer = BufferTexture('instance_data')
+        self.grow(capacity)
+
+        # The shader places every instance, so the model's own bounds would
+        # get the whole batch culled as soon as the origin is off screen.
+        self.model.node().set_bounds(OmniBoundingVolume())
+        self.model.node().set_final(True)
+        self.set_instance_shader(shader)
+        self.visible = False
+
+    def grow(self, capacity):
+        self.data.extend([0.0] * (capacity - self.capacity) * FLOATS_PER_INSTANCE)
+        self.capacity = capacity
+        self.buffer.setup_buffer_texture(capacity * INSTANCE_TEXELS, BufferTexture.T_float,
+                                         BufferTexture.F_rgba32, GeomEnums.UH_dynamic)
+        self.dirty = True
+
+    def set_instance_shader(self, shader):
+        apply_shader(self, shader)
+        self.set_shader_input('instance_data', self.buffer)
+        # GLSL compiles on first draw, so check it once a frame has been drawn
+        self.shader_check = 'pending'
+        self.dirty = True
+
+    def add(self, position, scale, prop_color, collider=None, shown=True):
+        index = len(self.instances)
+        if index >= self.capacity:
+            self.grow(self.capacity * 2)
+        start = index * FLOATS_PER_INSTANCE
+        self.data[start:start + FLOATS_PER_INSTANCE] = array('f', (
+            position[0], position[1], position[2], 0.0,
+            scale[0], scale[1], scale[2], 0.0,
+            prop_color[0], prop_color[1], prop_color[2], prop_color[3],
+        ))
+        prop = PropInstance(self, index, prop_color, shown=shown, position=position, scale=scale,
+                            collider=collider)
+        self.instances.append(prop)
+        self.dirty = True
+        return prop
+
+    def set_instance_visible(self, index, visible):
+        self.data[index * FLOATS_PER_INSTANCE + 3] = 1.0 if visible else 0.0
+        self.dirty = True
+
+    def clear(self):
+        for prop in self.instances:
+            if prop.renderer is self:
+                prop.renderer = None
+                destroy(prop)
+        self.instances.clear()
+        self.data = array('f', [0.0] * self.capacity * FLOATS_PER_INSTANCE)
+        self.dirty = True
+
+    def flush(self):
+        if not self.dirty:
+            return
+        self.dirty = False
+        self.buffer.set_ram_image(self.data.tobytes())
+        self.set_instance_count(len(self.instances))
+        # An instance count of 0 turns instancing off rather than drawing nothing.
+        self.visible = bool(self.instances) and not self.failed
+
+    def shader_compile_failed(self):
+        shader = getattr(self.shader, '_shader', self.shader)
+        return shader is None or shader.get_error_flag()
+
+    def fall_back(self):
+        self.failed = True
+        for prop in self.instances:
+            if prop.renderer is self:
+                prop.detach()
+        self.instances.clear()
+        self.visible = False
+
+    def update(self):
+        if self.failed:
+            return
+        self.flush()
+        if not self.instances:
+            return
+        if self.shader_check == 'pending':
+            self.shader_check = 'drawn'
+        elif self.shader_check == 'drawn':
+            self.shader_check = None
+            if self.shader_compile_failed():
+                print(f"Instanced shader failed to compile, drawing {len(self.instances)} props as entities")
+                self.fall_back()
@@ -0,0 +1,117 @@
+import random
+from collections import deque
+
+# --- Layout Constants ---
+ROOM_SIZE = 8
+NUM_ROOMS = 8
+DIRS = {'N': (0, 0, ROOM_SIZE), 'S': (0, 0, -ROOM_SIZE), 'E': (ROOM_SIZE, 0, 0), 'W': (-ROOM_SIZE, 0, 0)}
+OPPOSITE = {'N': 'S', 'S': 'N', 'E': 'W', 'W': 'E'}
+LOOT_CHANCE = 0.7
+
+
+# --- Layout ---
+class DungeonLayout:
+    """Room positions, doors, stairs and loot for one floor, without any entities."""
+
+    def __init__(self, positions, doors, stairs_room, loot_rooms):
+        self.positions = positions
+        self.doors = doors
+        self.stairs_room = stairs_room
+        self.loot_rooms = loot_rooms
+
+
+def generate_layout(num_rooms=NUM_ROOMS, rng=random):
+    """Grow a floor from room 0 by attaching each new room to a random existing one.
+
+    ``rng`` is anything with the ``random`` module's interface; pass a
+    ``random.Random(seed)`` for a reproducible floor.
+    """
+    stairs_room = rng.randint(1, num_rooms - 1)
+    positions = [(0, 0, 0)]
+    doors = [set()]
+    occupied = {(0, 0, 0)}
+    for i in range(1, num_rooms):
+        while True:
+            base_id = rng.choice(range(len(positions)))
+            base_pos = positions[base_id]
+            direction = rng.choice(list(DIRS.keys()))
+            new_pos = tuple(base_pos[j] + DIRS[direction][j] for j in range(3))
+            if new_pos not in occupied:
+                positions.append(new_pos)
+                occupied.add(new_pos)
+                doors[base_id].add(direction)
+                doors.append({OPPOSITE[direction]})
+                break
+    loot_rooms = set()
+    for i in range(1, num_rooms):
+        if rng.random() < LOOT_CHANCE:
+            loot_rooms.add(i)
+    return DungeonLayout(positions, doors, stairs_room, loot_rooms)
+
+
+# --- Validation ---
+def neighbour_id(layout, index, direction, by_pos=None):
+    if by_pos is None:
+        by_pos = {pos: i for i, pos in enumerate(layout.positions)}
+    pos = layout.positions[index]
+    target = tuple(pos[j] + DIRS[direction][j] for j in range(3))
+    return by_pos.get(target)
+
+
+def room_distances(layout):
+    """Steps through doors from room 0 to every reachable room."""
+    by_pos = {pos: i for i, pos in enumerate(layout.positions)}
+    distances = {0: 0}
+    queue = deque([0])
+    while queue:
+        index = queue.popleft()
+        for direction in layout.doors[index]:
+            other = neighbour_id(layout, index, direction, by_pos)
+            if other is not None and other not in distances:
+                distances[other] = distances[index] + 1
+                queue.append(other)
+    return distances
+
+
+def validate_layout(layout):
+    """Return a list of problems; an empty list means the floor is playable."""
+    problems = []
+    count = len(layout.positions)
+    if len(set(layout.positions)) != count:
+        problems.append('overlapping rooms')
+    if layout.stairs_room == 0:
+        problems.append('stairs in room 0')
+    elif not 0 < layout.stairs_room < count:
+        problems.append(f'stairs in missing room {layout.stairs_room}')
+
+    by_pos = {pos: i for i, pos in enumerate(layout.positions)}
+    for index, room_doors in enumerate(layout.doors):
+        for direction in room_doors:
+            other = neighbour_id(layout, index, direction, by_pos)
+            if other is None:
+                problems.append(f'room {index} door {direction} leads nowhere')
+            elif OPPOSITE[direction] not in layout.doors[other]:
+                problems.append(f'room {index} door {direction} has no matching door')
+
+    reachable = room_distances(layout)
+    if len(reachable) != count:
+        problems.append(f'{count - len(reachable)} rooms unreachable')
+    return problems
+
+
+def layout_stats(layout):
+    distances = room_distances(layout)
+    xs = [pos[0] for pos in layout.positions]
+    zs = [pos[2] for pos in layout.positions]
+    width = (max(xs) - min(xs)) // ROOM_SIZE + 1
+    depth = (max(zs) - min(zs)) // ROOM_SIZE + 1
+    return {
+        'rooms': len(layout.positions),
+        'dead_ends': sum(1 for room_doors in layout.doors if len(room_doors) == 1),
+        'loot': len(layout.loot_rooms),
+        'reachable_loot': sum(1 for i in layout.loot_rooms if i in distances),
+        'stairs_distance': distances.get(layout.stairs_room, -1),
+        'bbox_width': width,
+        'bbox_depth': depth,
+        'bbox_area': width * depth,
+    }
@@ -0,0 +1,132 @@
+from collections import deque
+import time
+
+# --- Quality Tiers ---
+# Ordered from cheapest to most expensive. minimap_interval is in seconds,
+# 0 redraws the minimap every frame.
+QUALITY_TIERS = [
+    {'name': 'low', 'shadows': False, 'shadows_size': 512, 'preload_rooms': 1,
+     'minimap_interval': 0.5, 'lighting': False},
+    {'name': 'medium', 'shadows': True, 'shadows_size': 1024, 'preload_rooms': 2,
+     'minimap_interval': 0.2, 'lighting': True},
+    {'name': 'high', 'shadows': True, 'shadows_size': 2048, 'preload_rooms': 4,
+     'minimap_interval': 0, 'lighting': True},
+]
+
+TARGET_FRAME_TIME = 1 / 60
+
+
+class QualityGovernor:
+    """Steps QUALITY_TIERS up or down to keep frame times inside a budget.
+
+    Frame times are averaged over a rolling window. One slow window steps
+    down straight away; stepping up needs several fast windows in a row.
+    A window only counts towards an upgrade when it leaves real headroom
+    (upgrade_ratio below 1). The count is kept per tier: it doubles whenever
+    an upgrade into the tier has to be undone and halves each time an upgrade
+    into it holds. After max_quick_reverts undone upgrades in a row the tier
+    is not tried again this session.
+
+    With vsync on, frames never finish faster than the display refresh, so
+    the budget is raised to the refresh interval via set_refresh_interval().
+    Paced frames leave no visible headroom, so under vsync the governor only
+    steps down.
+    """
+
+    def __init__(self, budget=TARGET_FRAME_TIME, window=60, tier=None,
+                 downgrade_ratio=1.15, upgrade_ratio=0.8, upgrade_windows=3,
+                 max_upgrade_windows=64, max_quick_reverts=3, spike_limit=0.25, max_log=100):
+        self.target_budget = budget
+        self.budget = budget
+        self.window = window
+        self.downgrade_ratio = downgrade_ratio
+        self.upgrade_ratio = upgrade_ratio
+        self.base_upgrade_windows = upgrade_windows
+        # Indexed by the tier being upgraded into.
+        self.upgrade_windows = [upgrade_windows] * len(QUALITY_TIERS)
+        self.max_upgrade_windows = max_upgrade_windows
+        self.max_quick_reverts = max_quick_reverts
+        self.quick_reverts = [0] * len(QUALITY_TIERS)
+        self.spike_limit = spike_limit
+        self.tier_index = len(QUALITY_TIERS) - 1 if tier is None else tier
+        self.samples = deque(maxlen=window)
+        self.good_windows = 0
+        self.last_change = None
+        self.windows_since_change = 0
+        self.decisions = deque(maxlen=max_log)
+
+    @property
+    def tier(self):
+        return QUALITY_TIERS[self.tier_index]
+
+    def reset(self):
+        self.samples.clear()
+        self.good_windows = 0
+
+    def tier_blocked(self, index):
+        return self.quick_reverts[index] >= self.max_quick_reverts
+
+    def set_refresh_interval(self, interval):
+        """Never ask for frames faster than the display can show them."""
+        self.budget = max(self.target_budget, interval or 0)
+        self.reset()
+
+    def record(self, dt):
+        """Add one frame time. Returns the new tier if it changed, else None."""
+        # Loading hitches (new floor, unpausing) say nothing about steady state.
+        if dt <= 0 or dt > self.spike_limit:
+            return None
+        self.samples.append(dt)
+        if len(self.samples) < self.window:
+            return None
+
+        average = sum(self.samples) / len(self.samples)
+        self.samples.clear()
+        self.windows_since_change += 1
+        current = self.tier_index
+
+        if average > self.budget * self.downgrade_ratio:
+            self.good_windows = 0
+            if current == 0:
+                return None
+            # Falling back soon after an upgrade means this tier is out of
+            # reach; later on it is just a heavier scene.
+            if self.last_change == 'up' and self.windows_since_change <= self.upgrade_windows[current]:
+                self.upgrade_windows[current] = min(self.upgrade_windows[current] * 2,
+                                                    self.max_upgrade_windows)
+                self.quick_reverts[current] += 1
+            return self._change(-1, average, 'frame time over budget')
+
+        if self.last_change == 'up' and self.windows_since_change > self.upgrade_windows[current]:
+            # The upgrade held; let its backoff decay rather than reset.
+            self.upgrade_windows[current] = max(self.upgrade_windows[current] // 2,
+                                                self.base_upgrade_windows)
+            self.quick_reverts[current] = 0
+            self.last_change = None
+
+        if (average <= self.budget * self.upgrade_ratio and current < len(QUALITY_TIERS) - 1
+                and not self.tier_blocked(current + 1)):
+            self.good_windows += 1
+            needed = self.upgrade_windows[current + 1]
+            if self.good_windows >= needed:
+                self.good_windows = 0
+                return self._change(1, average, f'{needed} windows within budget')
+            return None
+
+        self.good_windows = 0
+        return None
+
+    def _change(self, step, average, reason):
+        previous = self.tier['name']
+        self.tier_index += step
+        self.last_change = 'up' if step > 0 else 'down'
+        self.windows_since_change = 0
+        self.decisions.append({
+            'time': time.time(),
+            'from': previous,
+            'to': self.tier['name'],
+            'average_ms': average * 1000,
+            'budget_ms': self.budget * 1000,
+            'reason': reason,
+        })
+        return self.tier
@@ -71,4 +71,75 @@ def apply_shader(entity, shader):
         except Exception as e:
             print(f"Failed to apply shader: {str(e)}")
             # Fall back to no shader
-            entity.shader = None
\ No newline at end of file
+            entity.shader = None
+
+
+# Per-instance data lives in a buffer texture, three texels per instance:
+#   0: position.xyz, visible (1.0 or 0.0)
+#   1: scale.xyz, unused
+#   2: colour rgba
+INSTANCE_TEXELS = 3
+
+INSTANCED_VERTEX = '''
+#version 140
+uniform mat4 p3d_ModelViewProjectionMatrix;
+uniform samplerBuffer instance_data;
+in vec4 p3d_Vertex;
+in vec3 p3d_Normal;
+out vec3 vNormal;
+out vec4 vColor;
+
+void main() {
+    int base = gl_InstanceID * 3;
+    vec4 offset = texelFetch(instance_data, base);
+    vec4 scale = texelFetch(instance_data, base + 1);
+    vColor = texelFetch(instance_data, base + 2);
+    // Hidden instances collapse to a single point and draw nothing
+    vec3 pos = p3d_Vertex.xyz * scale.xyz * offset.w + offset.xyz;
+    gl_Position = p3d_ModelViewProjectionMatrix * vec4(pos, 1.0);
+    vNormal = p3d_Normal;
+}
+'''
+
+def create_instanced_shaders():
+    try:
+        # Same lighting as basic_lighting, colour comes from the instance
+        lighting_shader = Shader(
+            name='instanced_lighting',
+            language=Shader.GLSL,
+            vertex=INSTANCED_VERTEX,
+            fragment='''
+            #version 140
+            in vec3 vNormal;
+            in vec4 vColor;
+            out vec4 fragColor;
+            
+            void main() {
+                vec3 norm = normalize(vNormal);
+                float diff = max(dot(norm, vec3(0.0, 1.0, 0.0)), 0.3);
+                fragColor = vec4(vColor.rgb * diff, vColor.a);
+            }
+            '''
+        )
+        
+        # Flat colour like basic_wall
+        wall_shader = Shader(
+            name='instanced_wall',
+            language=Shader.GLSL,
+            vertex=INSTANCED_VERTEX,
+            fragment='''
+            #version 140
+            in vec4 vColor;
+            out vec4 fragColor;
+            
+            void main() {
+                fragColor = vColor;
+            }
+            '''
+        )
+        
+        return lighting_shader, wall_shader
+        
+    except Exception as e:
+        print(f"Failed to create instanced shaders: {str(e)}")
+        return None, None
@@ -0,0 +1,110 @@
+from quality import QUALITY_TIERS, QualityGovernor
+
+BUDGET = 1 / 60
+SLOW = BUDGET * 1.5
+FAST = BUDGET * 0.5
+WINDOW = 10
+HIGH = len(QUALITY_TIERS) - 1
+
+
+def make_governor(**kwargs):
+    return QualityGovernor(budget=BUDGET, window=WINDOW, **kwargs)
+
+
+def feed(governor, dt, windows=1):
+    changes = []
+    for _ in range(windows * WINDOW):
+        tier = governor.record(dt)
+        if tier:
+            changes.append(tier['name'])
+    return changes
+
+
+def test_one_slow_window_drops_a_tier():
+    governor = make_governor()
+    assert feed(governor, SLOW) == ['medium']
+    assert governor.tier_index == HIGH - 1
+
+
+def test_partial_window_does_not_decide():
+    governor = make_governor()
+    for _ in range(WINDOW - 1):
+        assert governor.record(SLOW) is None
+    assert governor.tier_index == HIGH
+
+
+def test_spikes_are_ignored():
+    governor = make_governor()
+    assert feed(governor, 1.0, windows=5) == []
+    assert governor.tier_index == HIGH
+
+
+def test_good_windows_raise_a_tier():
+    governor = make_governor(tier=0, upgrade_windows=3)
+    assert feed(governor, FAST, windows=2) == []
+    assert feed(governor, FAST) == ['medium']
+
+
+def test_window_at_budget_is_not_good_enough():
+    # Vsync-paced frames sit right at the budget and must not trigger upgrades.
+    governor = make_governor(tier=0)
+    assert feed(governor, BUDGET, windows=20) == []
+    assert governor.tier_index == 0
+
+
+def test_backoff_doubles_on_quick_revert():
+    governor = make_governor(tier=HIGH - 1, upgrade_windows=3)
+    assert feed(governor, FAST, windows=3) == ['high']
+    assert feed(governor, SLOW) == ['medium']
+    assert governor.upgrade_windows[HIGH] == 6
+    assert feed(governor, FAST, windows=5) == []
+    assert feed(governor, FAST) == ['high']
+
+
+def test_backoff_halves_when_upgrade_holds():
+    governor = make_governor(tier=HIGH - 1, upgrade_windows=3)
+    governor.upgrade_windows[HIGH] = 12
+    assert feed(governor, FAST, windows=12) == ['high']
+    # Holding for longer than the backoff counts as a successful upgrade.
+    feed(governor, FAST, windows=13)
+    assert governor.upgrade_windows[HIGH] == 6
+    assert governor.quick_reverts[HIGH] == 0
+
+
+def test_late_downgrade_keeps_backoff_of_other_tiers():
+    governor = make_governor(tier=HIGH - 1, upgrade_windows=3)
+    governor.upgrade_windows[HIGH] = 24
+    assert feed(governor, SLOW) == ['low']
+    assert governor.upgrade_windows[HIGH] == 24
+
+
+def test_tier_blocked_after_repeated_quick_reverts():
+    governor = make_governor(tier=HIGH - 1, upgrade_windows=1, max_quick_reverts=2)
+    for _ in range(2):
+        assert feed(governor, FAST, windows=governor.upgrade_windows[HIGH]) == ['high']
+        assert feed(governor, SLOW) == ['medium']
+    assert governor.tier_blocked(HIGH)
+    assert feed(governor, FAST, windows=200) == []
+    assert governor.tier_index == HIGH - 1
+
+
+def test_refresh_interval_raises_budget():
+    governor = make_governor()
+    governor.set_refresh_interval(1 / 50)
+    assert governor.budget == 1 / 50
+    assert feed(governor, 1 / 50, windows=10) == []
+    assert governor.tier_index == HIGH
+
+
+def test_unknown_refresh_keeps_target_budget():
+    governor = make_governor()
+    governor.set_refresh_interval(None)
+    assert governor.budget == BUDGET
+
+
+def test_decisions_are_logged():
+    governor = make_governor()
+    feed(governor, SLOW)
+    decision = governor.decisions[-1]
+    assert (decision['from'], decision['to']) == ('high', 'medium')
+    assert decision['average_ms'] > decision['budget_ms']